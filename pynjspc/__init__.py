@@ -1,12 +1,17 @@
 """pynjspc - Asynchronous Python client for njsPC pool controller."""
 
 from .client import NjsPCClient
+from .stats import QuantileSketch, RollingStatistics, TelemetryAggregator
 from .exceptions import (
     NjsPCError,
     ConnectionError,
     ConnectionTimeoutError,
     NotConnectedError,
+    CommandError,
+    CircuitOpenError,
 )
+from .policy import CircuitBreaker, CircuitBreakerState, RetryPolicy
+from .desired_state import PlannedCommand
 from .const import (
     DEFAULT_HOST,
     DEFAULT_PORT,
@@ -17,6 +22,21 @@ from .const import (
     DEFAULT_WATCHDOG_TIMEOUT,
     DEFAULT_FALLBACK_WATCHDOG_SLEEP,
     DEFAULT_UNKNOWN_EVENTS_LOG,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_MAX_DELAY,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+    DEFAULT_SNAPSHOT_PATH,
+    DEFAULT_SNAPSHOT_INTERVAL,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DEFAULT_STATS_WINDOWS,
+    DEFAULT_STATS_CAPACITY,
+    DEFAULT_STATS_QUANTILES,
+    DEFAULT_STATS_RELATIVE_ACCURACY,
+    DEFAULT_STATS_METRICS,
+    DEFAULT_APPLY_CONCURRENCY,
     ApiEndpoints,
     SocketIOEventsInbound,
     # SocketIOEventsOutbound,
@@ -29,10 +49,19 @@ __all__ = [
     "__version__",
     "VERSION",
     "NjsPCClient",
+    "TelemetryAggregator",
+    "RollingStatistics",
+    "QuantileSketch",
     "NjsPCError",
     "ConnectionError",
     "ConnectionTimeoutError",
     "NotConnectedError",
+    "CommandError",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitBreakerState",
+    "PlannedCommand",
     "DEFAULT_HOST",
     "DEFAULT_PORT",
     "DEFAULT_REQUEST_TIMEOUT",
@@ -42,6 +71,21 @@ __all__ = [
     "DEFAULT_WATCHDOG_TIMEOUT",
     "DEFAULT_FALLBACK_WATCHDOG_SLEEP",
     "DEFAULT_UNKNOWN_EVENTS_LOG",
+    "DEFAULT_RETRY_ATTEMPTS",
+    "DEFAULT_RETRY_BASE_DELAY",
+    "DEFAULT_RETRY_MAX_DELAY",
+    "DEFAULT_HEDGE_DELAY",
+    "DEFAULT_BREAKER_FAILURE_THRESHOLD",
+    "DEFAULT_BREAKER_RECOVERY_TIMEOUT",
+    "DEFAULT_SNAPSHOT_PATH",
+    "DEFAULT_SNAPSHOT_INTERVAL",
+    "DEFAULT_SNAPSHOT_MAX_AGE",
+    "DEFAULT_STATS_WINDOWS",
+    "DEFAULT_STATS_CAPACITY",
+    "DEFAULT_STATS_QUANTILES",
+    "DEFAULT_STATS_RELATIVE_ACCURACY",
+    "DEFAULT_STATS_METRICS",
+    "DEFAULT_APPLY_CONCURRENCY",
     "ApiEndpoints",
     "SocketIOEventsInbound",
     # "SocketIOEventsOutbound",
@@ -0,0 +1,153 @@
+"""Field-level change detection for njsPC entity events."""
+
+import logging
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# (path, old value, new value)
+Change = Tuple[str, Any, Any]
+ChangeCallback = Callable[[str, Any, Any], None]
+
+
+def entity_path(event: str, entity_id: Optional[Hashable] = None) -> str:
+    """Build the root path of an entity, e.g. ``pump[1]`` or ``temps``."""
+    if entity_id is None:
+        return event
+    return f"{event}[{entity_id}]"
+
+
+def entity_id_of(data: Any) -> Optional[Hashable]:
+    """Return the ``id`` of an entity payload, or None for singleton payloads."""
+    if isinstance(data, dict):
+        entity_id = data.get("id")
+        if isinstance(entity_id, (int, str)):
+            return entity_id
+    return None
+
+
+def get_path(data: Any, path: str) -> Any:
+    """Resolve a dotted field path (e.g. ``ph.level``) inside a payload."""
+    for key in path.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def parent_paths(path: str) -> List[str]:
+    """Return ``path`` and all of its ancestors, shortest first.
+
+    ``pump[1].status.val`` yields ``pump``, ``pump[1]``, ``pump[1].status``
+    and ``pump[1].status.val``.
+    """
+    paths = []
+    for i, char in enumerate(path):
+        if char in ".[" and i > 0:
+            paths.append(path[:i])
+    paths.append(path)
+    return paths
+
+
+def diff(old: Any, new: Any, path: str, changes: List[Change]) -> Any:
+    """Append the leaf-level differences between ``old`` and ``new`` to ``changes``.
+
+    Dictionaries are compared key by key; keys missing from ``new`` are kept
+    from ``old`` since njsPC may send partial payloads. Any other value
+    (including lists) is compared as a whole. Returns the merged value.
+    """
+    if isinstance(new, dict):
+        if not isinstance(old, dict):
+            if old is not None:
+                changes.append((path, old, new))
+                return dict(new)
+            old = {}
+        merged = dict(old)
+        for key, value in new.items():
+            merged[key] = diff(old.get(key), value, f"{path}.{key}", changes)
+        return merged
+    if old != new:
+        changes.append((path, old, new))
+    return new
+
+
+class ChangeTracker:
+    """Keep the last known payload of each entity and dispatch field changes.
+
+    Subscriptions are keyed by path in a path index. A subscription to
+    ``pump[1].watts`` fires only when that field changes, while a subscription
+    to ``pump[1]`` or ``pump`` fires for every field changed underneath it.
+    Callbacks receive ``(path, old, new)`` for each changed leaf.
+    """
+
+    def __init__(self) -> None:
+        self._entities: Dict[str, Dict[Optional[Hashable], Dict[str, Any]]] = {}
+        self._subscriptions: Dict[str, Set[ChangeCallback]] = {}
+
+    def subscribe(self, path: str, callback: ChangeCallback) -> None:
+        """Register ``callback`` for changes at or below ``path``."""
+        self._subscriptions.setdefault(path, set()).add(callback)
+
+    def unsubscribe(self, path: str, callback: ChangeCallback) -> None:
+        """Unregister a callback previously registered with :meth:`subscribe`."""
+        if path in self._subscriptions:
+            self._subscriptions[path].discard(callback)
+            if not self._subscriptions[path]:
+                del self._subscriptions[path]
+
+    def clear_subscriptions(self) -> None:
+        """Remove all change subscriptions."""
+        self._subscriptions.clear()
+
+    def get(self, event: str, entity_id: Optional[Hashable] = None) -> Optional[Dict[str, Any]]:
+        """Return the last known payload of an entity, or None if never seen."""
+        return self._entities.get(event, {}).get(entity_id)
+
+    def export(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return all last known payloads as lists per event."""
+        return {
+            event: list(entities.values())
+            for event, entities in self._entities.items()
+        }
+
+    def retain(self, event: str, entity_ids: Set[Optional[Hashable]]) -> List[Change]:
+        """Forget the entities of an event whose id is not in ``entity_ids``.
+
+        Each removed entity is dispatched as a change of its root path (e.g.
+        ``circuit[6]``) from its last payload to None. Returns the changes.
+        """
+        known = self._entities.get(event)
+        changes: List[Change] = []
+        if known:
+            for entity_id in set(known) - entity_ids:
+                changes.append((entity_path(event, entity_id), known.pop(entity_id), None))
+        if changes and self._subscriptions:
+            self._dispatch(changes)
+        return changes
+
+    def update(self, event: str, data: Any) -> List[Change]:
+        """Merge a new payload for an entity and dispatch its field changes.
+
+        The first payload for an entity reports every field as changed from
+        None. Returns the list of changes found.
+        """
+        if not isinstance(data, dict):
+            return []
+        entity_id = entity_id_of(data)
+        known = self._entities.setdefault(event, {})
+        changes: List[Change] = []
+        known[entity_id] = diff(
+            known.get(entity_id), data, entity_path(event, entity_id), changes
+        )
+        if changes and self._subscriptions:
+            self._dispatch(changes)
+        return changes
+
+    def _dispatch(self, changes: List[Change]) -> None:
+        for path, old, new in changes:
+            for subscribed in parent_paths(path):
+                for callback in list(self._subscriptions.get(subscribed, ())):
+                    try:
+                        callback(path, old, new)
+                    except Exception as e:
+                        _LOGGER.error(f"Error in change callback for '{subscribed}': {e}")
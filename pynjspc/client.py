@@ -5,8 +5,9 @@ import json
 import logging
 import socket
 import time
-from typing import Callable, Dict, Set, Optional, Any, Union
+from typing import Callable, Dict, Hashable, List, Mapping, Set, Optional, Any, Tuple, Union
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import socketio
 import aiohttp
@@ -20,16 +21,28 @@ from pynjspc.const import (
     DEFAULT_MAX_RECONNECT_ATTEMPTS,
     DEFAULT_WATCHDOG_TIMEOUT,
     DEFAULT_UNKNOWN_EVENTS_LOG,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_SNAPSHOT_PATH,
+    DEFAULT_SNAPSHOT_INTERVAL,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    DEFAULT_APPLY_CONCURRENCY,
+    STATE_COLLECTIONS,
     ApiEndpoints,
     SocketIOEventsInbound,
     # SocketIOEventsOutbound,
 )
 
+from .changes import ChangeCallback, ChangeTracker, entity_id_of
+from .desired_state import PlannedCommand, plan_commands
 from .exceptions import (
+    CircuitOpenError,
+    CommandError,
     ConnectionError as NjsPCConnectionError,
     ConnectionTimeoutError,
     NotConnectedError,
 )
+from .policy import CircuitBreaker, CircuitBreakerState, RetryPolicy
+from .snapshot import read_snapshot, write_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +61,12 @@ class NjsPCClient:
         max_reconnect_attempts: Optional[int] = None,
         watchdog_timeout: Optional[float] = None,
         unknown_events_log: Optional[Union[str, Path]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_delay: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        snapshot_path: Optional[Union[str, Path]] = None,
+        snapshot_interval: Optional[float] = None,
+        snapshot_max_age: Optional[float] = None,
     ):
         self.host: str = str(host or DEFAULT_HOST)
         self.port: int = int(port or DEFAULT_PORT)
@@ -82,8 +101,40 @@ class NjsPCClient:
             )
         else:
             self._unknown_events_log = DEFAULT_UNKNOWN_EVENTS_LOG
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self._hedge_delay: Optional[float] = (
+            float(hedge_delay) if hedge_delay is not None else DEFAULT_HEDGE_DELAY
+        )
+        self._circuit_breaker: CircuitBreaker = circuit_breaker or CircuitBreaker()
+        if snapshot_path is not None and snapshot_path != "":
+            self._snapshot_path: Optional[Union[str, Path]] = str(snapshot_path)
+        else:
+            self._snapshot_path = DEFAULT_SNAPSHOT_PATH
+        self._snapshot_interval: float = (
+            float(snapshot_interval)
+            if snapshot_interval is not None
+            else float(DEFAULT_SNAPSHOT_INTERVAL)
+        )
+        self._snapshot_max_age: float = (
+            float(snapshot_max_age)
+            if snapshot_max_age is not None
+            else float(DEFAULT_SNAPSHOT_MAX_AGE)
+        )
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._snapshot_lock: Optional[asyncio.Lock] = None
+        self._snapshot_write: Optional[asyncio.Future] = None
+        self._snapshot_saved_at: Optional[float] = None
+        self._snapshot_loaded: bool = False
+        self._snapshot_dirty: bool = False
+        self._state_fetched: bool = False
+        self._stale: bool = False
+        self._config: Optional[Dict[str, Any]] = None
         self._connected: bool = False
         self._event_callbacks: Dict[str, Set[Callable[[Any], None]]] = {}
+        self._changes: ChangeTracker = ChangeTracker()
+        self._waiters: Dict[
+            Tuple[str, Hashable], List[Tuple[PlannedCommand, asyncio.Future]]
+        ] = {}
         self._reconnect_attempts: int = 0
         self._monitor_task: Optional[asyncio.Task] = None
         self._monitor_stop: bool = False
@@ -118,6 +169,8 @@ class NjsPCClient:
         async def _on_disconnect() -> None:
             if self._connected:
                 self._connected = False
+                # Events may be missed until the next full state fetch
+                self._stale = True
                 self._update_activity()
                 _LOGGER.warning("Disconnected from njsPC server")
 
@@ -134,7 +187,14 @@ class NjsPCClient:
         return f"http://{ip}:{port or self.port}"
 
     async def connect(self, timeout: float = 10.0) -> None:
-        """Establish connection to the controller. Starts connection monitor if enabled. Enforces timeout."""
+        """Establish connection to the controller. Starts connection monitor if enabled. Enforces timeout.
+
+        If a snapshot path is configured, the last saved snapshot is loaded
+        first (see :meth:`load_snapshot`) and reconciled with a full state
+        fetch once connected.
+        """
+        if self._snapshot_path is not None and not self._snapshot_loaded:
+            await self.load_snapshot()
         self._socket = socketio.AsyncClient()
         self._connected = False
         self._handlers_registered = False
@@ -154,6 +214,15 @@ class NjsPCClient:
             _LOGGER.error(
                 f"Failed to connect to njsPC server: {e}. Will attempt to reconnect."
             )
+        if self._connected and self._stale:
+            try:
+                await self.fetch_full_state()
+            except Exception as e:
+                _LOGGER.warning(f"Failed to reconcile snapshot with controller state: {e}")
+        if self._snapshot_path is not None and (
+            self._snapshot_task is None or self._snapshot_task.done()
+        ):
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
         if self._auto_reconnect and (
             self._monitor_task is None or self._monitor_task.done()
         ):
@@ -178,6 +247,7 @@ class NjsPCClient:
             except asyncio.CancelledError:
                 pass
             self._monitor_task = None
+        await self._stop_snapshot_task()
 
     async def async_close(self) -> None:
         """Asynchronously close the socket connection and clean up resources."""
@@ -196,6 +266,120 @@ class NjsPCClient:
             except asyncio.CancelledError:
                 pass
             self._monitor_task = None
+        await self._stop_snapshot_task()
+
+    async def _stop_snapshot_task(self) -> None:
+        """Internal: Stop periodic snapshots and save any unsaved changes."""
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        if self._snapshot_write is not None:
+            # A cancelled save leaves its write running in the executor
+            await asyncio.wait({self._snapshot_write})
+        if self._snapshot_dirty:
+            await self.save_snapshot()
+
+    async def _snapshot_loop(self) -> None:
+        """Background task saving a snapshot every snapshot interval when state changed."""
+        try:
+            while True:
+                await asyncio.sleep(self._snapshot_interval)
+                if self._snapshot_dirty:
+                    await self.save_snapshot()
+        except asyncio.CancelledError:
+            pass
+
+    async def save_snapshot(self) -> None:
+        """Save the last known state and config to the snapshot file.
+
+        The file is serialized and written atomically in an executor thread so
+        the event loop is not blocked. Saves are serialized, so an older
+        snapshot never replaces a newer one. Errors are logged, not raised.
+        """
+        if self._snapshot_path is None:
+            return
+        if self._snapshot_lock is None:
+            self._snapshot_lock = asyncio.Lock()
+        async with self._snapshot_lock:
+            if self._snapshot_write is not None:
+                # Wait for a write left running by a cancelled save
+                await asyncio.wait({self._snapshot_write})
+            snapshot = {
+                "host": self.host,
+                "port": self.port,
+                "savedAt": time.time(),
+                "entities": self._changes.export(),
+                "config": self._config,
+            }
+            self._snapshot_dirty = False
+            write = asyncio.get_running_loop().run_in_executor(
+                None, write_snapshot, self._snapshot_path, snapshot
+            )
+            write.add_done_callback(self._on_snapshot_written)
+            self._snapshot_write = write
+            # Cancelling the save does not stop the write; its outcome is
+            # handled by _on_snapshot_written either way.
+            await asyncio.wait({write})
+
+    def _on_snapshot_written(self, write: asyncio.Future) -> None:
+        """Internal: Log the outcome of a snapshot write and keep failed state dirty."""
+        if self._snapshot_write is write:
+            self._snapshot_write = None
+        error = None if write.cancelled() else write.exception()
+        if write.cancelled() or error is not None:
+            self._snapshot_dirty = True
+            _LOGGER.error(f"Failed to save snapshot to {self._snapshot_path}: {error}")
+        else:
+            _LOGGER.debug(f"Saved snapshot to {self._snapshot_path}")
+
+    async def load_snapshot(self) -> bool:
+        """Load the last saved snapshot as the known state, marked as stale.
+
+        Change callbacks fire for the loaded values and :meth:`get_entity`
+        returns them right away. The state stays stale until the next
+        successful :meth:`fetch_full_state`, which :meth:`connect` performs
+        automatically. Snapshots of another host/port or older than the
+        snapshot max age are ignored. Returns True if a snapshot was loaded.
+        """
+        if self._snapshot_path is None:
+            return False
+        self._snapshot_loaded = True
+        snapshot = await asyncio.get_running_loop().run_in_executor(
+            None, read_snapshot, self._snapshot_path
+        )
+        if snapshot is None or self._state_fetched:
+            return False
+        if snapshot.get("host") != self.host or snapshot.get("port") != self.port:
+            _LOGGER.warning(
+                f"Ignoring snapshot {self._snapshot_path} of "
+                f"{snapshot.get('host')}:{snapshot.get('port')}"
+            )
+            return False
+        saved_at = snapshot.get("savedAt")
+        if not isinstance(saved_at, (int, float)):
+            _LOGGER.warning(f"Ignoring snapshot {self._snapshot_path} without timestamp")
+            return False
+        age = time.time() - saved_at
+        if age > self._snapshot_max_age:
+            _LOGGER.warning(
+                f"Ignoring snapshot {self._snapshot_path} saved {age:.0f} seconds ago"
+            )
+            return False
+        for event, entities in (snapshot.get("entities") or {}).items():
+            if SocketIOEventsInbound.is_known_event(event) and isinstance(entities, list):
+                for entity in entities:
+                    self._update_entity(event, entity)
+        if self._config is None and isinstance(snapshot.get("config"), dict):
+            self._config = snapshot["config"]
+        self._snapshot_saved_at = float(saved_at)
+        self._stale = True
+        self._snapshot_dirty = False
+        _LOGGER.info(f"Loaded snapshot from {self._snapshot_path} ({age:.0f} seconds old)")
+        return True
 
     async def _cleanup_socket(self) -> None:
         """Internal method to clean up socket connection without stopping monitor."""
@@ -206,6 +390,7 @@ class NjsPCClient:
                 _LOGGER.warning(f"Exception during socket disconnect: {e}")
             self._socket = None
         self._connected = False
+        self._stale = True
 
     # async def emit(self, event: SocketIOEventsOutbound, data: Optional[Dict[str, Any]] = None) -> None:
     #     """Emit an event to the controller."""
@@ -244,23 +429,21 @@ class NjsPCClient:
 
         try:
             _LOGGER.debug(f"Fetching full state from {url}")
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise NjsPCConnectionError(
-                            f"HTTP {response.status}: Failed to fetch state from {url}"
-                        )
-
-                    state = await response.json()
-                    _LOGGER.debug(f"Fetched full state: {state}")
+            status, text = await self._request("GET", url, timeout=timeout)
+            if status != 200:
+                raise NjsPCConnectionError(
+                    f"HTTP {status}: Failed to fetch state from {url}"
+                )
+            state = json.loads(text)
+            _LOGGER.debug(f"Fetched full state: {state}")
         except asyncio.TimeoutError:
             raise ConnectionTimeoutError(
                 f"fetch_full_state timed out after {timeout} seconds"
             )
         except aiohttp.ClientError as e:
             raise NjsPCConnectionError(f"Failed to fetch full state: {e}")
+        except ValueError as e:
+            raise NjsPCConnectionError(f"Invalid state received from {url}: {e}")
         except Exception as e:
             _LOGGER.error(f"Failed to fetch full state: {e}")
             raise
@@ -269,14 +452,53 @@ class NjsPCClient:
             state = {}
 
         self._update_activity()
+        self._ingest_state(state)
+        self._state_fetched = True
+        self._stale = False
         return state
 
+    async def fetch_full_config(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Fetch the full controller config via HTTP GET request to ApiEndpoints.CONFIG_ALL endpoint."""
+        config = await self.send_command(
+            ApiEndpoints.CONFIG_ALL, method="GET", timeout=timeout
+        )
+        self._config = config
+        self._snapshot_dirty = True
+        return config
+
+    def _ingest_state(self, state: Dict[str, Any]) -> None:
+        """Internal: Merge the entities of a state/all payload into the known state.
+
+        Entities of a collection that are missing from the payload are dropped
+        and reported to change callbacks as changing to None.
+        """
+        for key, event in STATE_COLLECTIONS.items():
+            items = state.get(key)
+            if isinstance(items, list):
+                if self._changes.retain(
+                    event.value, {entity_id_of(item) for item in items}
+                ):
+                    self._snapshot_dirty = True
+                for item in items:
+                    self._update_entity(event.value, item)
+        temps = state.get("temps")
+        if isinstance(temps, dict):
+            bodies = temps.get("bodies") or []
+            if self._changes.retain(
+                SocketIOEventsInbound.BODY.value, {entity_id_of(body) for body in bodies}
+            ):
+                self._snapshot_dirty = True
+            for body in bodies:
+                self._update_entity(SocketIOEventsInbound.BODY.value, body)
+            self._update_entity(SocketIOEventsInbound.TEMPS.value, temps)
+
     async def send_command(
         self,
         endpoint: ApiEndpoints,
         data: Optional[Dict[str, Any]] = None,
         method: str = "PUT",
         timeout: Optional[float] = None,
+        idempotent: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """Send a command to the controller via HTTP API.
 
@@ -284,7 +506,10 @@ class NjsPCClient:
             endpoint: The API endpoint to send the command to
             data: The command data/payload to send
             method: HTTP method to use (GET, POST, PUT, DELETE)
-            timeout: Request timeout in seconds
+            timeout: Overall timeout in seconds, retries included
+            idempotent: Whether the command may safely be retried. Defaults to
+                True for GET requests only; pass True for commands that set an
+                absolute value (e.g. ``{"id": 6, "state": True}``).
 
         Returns:
             Dict containing the response from the server
@@ -292,6 +517,7 @@ class NjsPCClient:
         Raises:
             NjsPCConnectionError: If the HTTP request fails
             ConnectionTimeoutError: If the request times out
+            CircuitOpenError: If the controller's circuit breaker is open
             ValueError: If the data cannot be serialized to JSON
         """
         if not self._connected:
@@ -312,25 +538,26 @@ class NjsPCClient:
             except TypeError as e:
                 raise ValueError(f"Data could not be serialized to JSON: {e}")
 
+        if idempotent is None:
+            idempotent = method.upper() == "GET"
+
         try:
             _LOGGER.debug(f"Sending {method} command to {url} with data: {data}")
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as session:
-                async with session.request(method, url, json=data) as response:
-                    if response.status not in [200, 201, 202]:
-                        response_text = await response.text()
-                        raise NjsPCConnectionError(
-                            f"HTTP {response.status}: Command failed at {url}. Response: {response_text}"
-                        )
+            status, text = await self._request(
+                method, url, data, timeout=timeout, idempotent=idempotent
+            )
+            if status not in [200, 201, 202]:
+                raise NjsPCConnectionError(
+                    f"HTTP {status}: Command failed at {url}. Response: {text}"
+                )
 
-                    # Try to parse JSON response, fallback to text if not JSON
-                    try:
-                        result = await response.json()
-                        _LOGGER.debug(f"Command response: {result}")
-                    except Exception:
-                        result = {"response": await response.text()}
-                        _LOGGER.debug(f"Command response (text): {result}")
+            # Try to parse JSON response, fallback to text if not JSON
+            try:
+                result = json.loads(text)
+                _LOGGER.debug(f"Command response: {result}")
+            except ValueError:
+                result = {"response": text}
+                _LOGGER.debug(f"Command response (text): {result}")
 
         except asyncio.TimeoutError:
             raise ConnectionTimeoutError(
@@ -345,6 +572,135 @@ class NjsPCClient:
         self._update_activity()
         return result
 
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: float,
+        idempotent: bool = True,
+    ) -> Tuple[int, str]:
+        """Internal: Send an HTTP request through the retry, hedging and breaker policies.
+
+        Timeouts, ``aiohttp.ClientError`` and 5xx responses count as failures
+        for the circuit breaker and are retried with jittered backoff when the
+        request is idempotent. Idempotent ``state/*`` GETs are hedged when a
+        hedge delay is configured. ``timeout`` is a deadline for the whole
+        call, retries included. Returns the status and body of the last
+        response; the last error is re-raised once attempts or time run out, or
+        once the breaker opens mid-call. CircuitOpenError is raised only when
+        the breaker rejects the first attempt.
+        """
+        hedge = (
+            self._hedge_delay is not None
+            and method.upper() == "GET"
+            and urlsplit(url).path.startswith("/state/")
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        attempts = self._retry_policy.attempts if idempotent else 1
+        response: Optional[Tuple[int, str]] = None
+        error: Optional[BaseException] = None
+        for attempt in range(attempts):
+            if attempt:
+                delay = min(
+                    self._retry_policy.backoff(attempt - 1), deadline - loop.time()
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if loop.time() >= deadline:
+                    break
+            if not self._circuit_breaker.allow():
+                if attempt:
+                    # Our own failures opened the breaker: report the last one
+                    break
+                raise CircuitOpenError(
+                    f"Circuit breaker open for {self.host}; retry in "
+                    f"{self._circuit_breaker.retry_after:.1f} seconds"
+                )
+            try:
+                if hedge:
+                    status, text = await self._hedged_attempt(
+                        method, url, data, deadline
+                    )
+                else:
+                    status, text = await self._attempt(method, url, data, deadline)
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                self._circuit_breaker.record_failure()
+                response, error = None, e
+                _LOGGER.debug(f"{method} {url} attempt {attempt + 1} failed: {e!r}")
+                continue
+            if status < 500:
+                self._circuit_breaker.record_success()
+                return status, text
+            self._circuit_breaker.record_failure()
+            response, error = (status, text), None
+            _LOGGER.debug(f"{method} {url} attempt {attempt + 1} returned HTTP {status}")
+        if response is not None:
+            return response
+        raise error if error is not None else asyncio.TimeoutError()
+
+    async def _attempt(
+        self, method: str, url: str, data: Optional[Dict[str, Any]], deadline: float
+    ) -> Tuple[int, str]:
+        """Internal: Send a single HTTP request and return its status and body."""
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=remaining)
+        ) as session:
+            async with session.request(method, url, json=data) as response:
+                return response.status, await response.text()
+
+    async def _hedged_attempt(
+        self, method: str, url: str, data: Optional[Dict[str, Any]], deadline: float
+    ) -> Tuple[int, str]:
+        """Internal: Send a request, and a second copy if the first is slower than the hedge delay.
+
+        The first non-5xx response wins and the other request is cancelled.
+        Both requests are cancelled if the caller is.
+        """
+        pending = {asyncio.ensure_future(self._attempt(method, url, data, deadline))}
+        response: Optional[Tuple[int, str]] = None
+        error: Optional[BaseException] = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self._hedge_delay)
+            if not done:
+                _LOGGER.debug(f"{method} {url} slower than {self._hedge_delay}s, hedging")
+                pending.add(
+                    asyncio.ensure_future(self._attempt(method, url, data, deadline))
+                )
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                    elif task.result()[0] < 500:
+                        return task.result()
+                    else:
+                        response = task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        if response is not None:
+            return response
+        assert error is not None
+        raise error
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker:
+        """Return the circuit breaker guarding requests to this controller."""
+        return self._circuit_breaker
+
+    @property
+    def breaker_state(self) -> CircuitBreakerState:
+        """Return the state of this controller's circuit breaker."""
+        return self._circuit_breaker.state
+
     def on(self, event: SocketIOEventsInbound, callback: Callable) -> None:
         """Register an event handler for a specific event. Supports multiple callbacks per event."""
         if event.value not in self._event_callbacks:
@@ -360,11 +716,38 @@ class NjsPCClient:
                 del self._event_callbacks[event.value]
 
     def remove(self, event: Optional[SocketIOEventsInbound] = None) -> None:
-        """Remove all handlers for a specific event, or all events if no event is given."""
+        """Remove all handlers for a specific event, or all events if no event is given.
+
+        Without an event, change callbacks registered with :meth:`on_change`
+        are removed as well.
+        """
         if event is not None:
             self._event_callbacks.pop(event.value, None)
         else:
             self._event_callbacks.clear()
+            self._changes.clear_subscriptions()
+
+    def on_change(self, path: str, callback: ChangeCallback) -> None:
+        """Register a callback for field changes at or below a path.
+
+        Paths are built from the event name, the entity id and the field
+        names, e.g. ``pump[1].watts``, ``chemController[1].ph.level`` or
+        ``temps.waterSensor1``. The callback is called with ``(path, old, new)``
+        only when a value actually differs from the last payload received for
+        the same entity.
+        """
+        _LOGGER.debug(f"Registering change callback for path '{path}'")
+        self._changes.subscribe(path, callback)
+
+    def off_change(self, path: str, callback: ChangeCallback) -> None:
+        """Unregister a change callback."""
+        self._changes.unsubscribe(path, callback)
+
+    def get_entity(
+        self, event: SocketIOEventsInbound, entity_id: Optional[Union[int, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the last known payload received for an entity, or None."""
+        return self._changes.get(event.value, entity_id)
 
     def _handle_event(self, event: str, data: Any) -> None:
         """Internal: Call all registered callbacks for an event.
@@ -379,8 +762,10 @@ class NjsPCClient:
             except Exception as e:
                 _LOGGER.error(f"Error in event callback for '{event}': {e}")
 
-        # Log the event if it's not a known event
-        if not SocketIOEventsInbound.is_known_event(event):
+        if SocketIOEventsInbound.is_known_event(event):
+            self._update_entity(event, data)
+        else:
+            # Log the event if it's not a known event
             _LOGGER.warning(f"Unknown event '{event}' received with data: {data}")
             if self._unknown_events_log:
                 with open(self._unknown_events_log, "a") as log_file:
@@ -388,6 +773,17 @@ class NjsPCClient:
                         f"Unknown event '{event}' received with data: {data}\n"
                     )
 
+    def _update_entity(self, event: str, data: Any) -> None:
+        """Internal: Record an entity payload and resolve commands it confirms."""
+        if self._changes.update(event, data):
+            self._snapshot_dirty = True
+        waiters = self._waiters.get((event, entity_id_of(data)))
+        if waiters:
+            entity = self._changes.get(event, entity_id_of(data))
+            for command, future in waiters:
+                if not future.done() and command.is_satisfied_by(entity):
+                    future.set_result(True)
+
     async def _connection_monitor(self) -> None:
         """Background task to monitor connection health and handle reconnections."""
         try:
@@ -472,7 +868,122 @@ class NjsPCClient:
         if not self._connected:
             raise NotConnectedError("Not connected to njsPC server.")
         data = {"id": circuit_id, "state": state}
-        return await self.send_command(ApiEndpoints.CIRCUIT_SETSTATE, data)
+        return await self.send_command(
+            ApiEndpoints.CIRCUIT_SETSTATE, data, idempotent=True
+        )
+
+    async def apply(
+        self,
+        desired_state: Mapping[str, Mapping[Hashable, Any]],
+        *,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[PlannedCommand]:
+        """Bring the controller to a desired state with as few commands as possible.
+
+        The desired state is compared with the last known state (fetched once
+        via ``state/all`` if an entity has not been seen yet or the state is
+        stale, see :attr:`state_is_stale`) and only the commands that change
+        something are sent. Commands for different entities run concurrently, at most
+        ``max_concurrency`` at a time; commands for the same entity run in
+        order. Each command is confirmed by its HTTP response or the matching
+        socket event.
+
+        Args:
+            desired_state: Desired settings per section and entity id, e.g.
+                ``{"circuits": {6: True}, "bodies": {2: {"setPoint": 102}}}``.
+                See :func:`pynjspc.desired_state.plan_commands`.
+            max_concurrency: Maximum number of commands in flight
+            timeout: Timeout in seconds for each command, retries and
+                confirmation included
+
+        Returns:
+            The commands that were sent
+
+        Raises:
+            CommandError: If any command failed or was not confirmed in time
+            ValueError: If the desired state contains unsupported settings
+            NotConnectedError: If the client is not connected
+            NjsPCConnectionError: If the current state cannot be fetched
+                (``ConnectionTimeoutError`` and ``CircuitOpenError`` included)
+        """
+        if not self._connected:
+            raise NotConnectedError("Not connected to njsPC server.")
+        if timeout is None:
+            timeout = self._request_timeout
+
+        commands = plan_commands(desired_state, self._lookup_entity)
+        if self._stale or any(
+            self._lookup_entity(command.event, command.entity_id) is None
+            for command in commands
+        ):
+            await self.fetch_full_state(timeout=timeout)
+            commands = plan_commands(desired_state, self._lookup_entity)
+        if not commands:
+            _LOGGER.debug("Desired state already reached, no commands to send")
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_APPLY_CONCURRENCY)
+        groups: Dict[Tuple[str, Hashable], List[PlannedCommand]] = {}
+        for command in commands:
+            groups.setdefault((command.event.value, command.entity_id), []).append(
+                command
+            )
+
+        async def run_group(group: List[PlannedCommand]) -> None:
+            for command in group:
+                async with semaphore:
+                    await self._run_planned_command(command, timeout)
+
+        results = await asyncio.gather(
+            *(run_group(group) for group in groups.values()), return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            raise CommandError(
+                f"{len(failures)} of {len(groups)} entities could not be set: "
+                + "; ".join(str(failure) for failure in failures)
+            )
+        return commands
+
+    def _lookup_entity(
+        self, event: SocketIOEventsInbound, entity_id: Hashable
+    ) -> Optional[Dict[str, Any]]:
+        return self._changes.get(event.value, entity_id)
+
+    async def _run_planned_command(self, command: PlannedCommand, timeout: float) -> None:
+        """Internal: Send a planned command and wait until it is confirmed."""
+        key = (command.event.value, command.entity_id)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        future: asyncio.Future = loop.create_future()
+        waiter = (command, future)
+        self._waiters.setdefault(key, []).append(waiter)
+        try:
+            try:
+                result = await self.send_command(
+                    command.endpoint, command.data, timeout=timeout, idempotent=True
+                )
+            except Exception as e:
+                raise CommandError(
+                    f"{command.endpoint.value} {command.data} failed: {e}"
+                ) from e
+            # njsPC answers with the updated entity, which usually confirms it
+            if isinstance(result, dict) and entity_id_of(result) == command.entity_id:
+                self._update_entity(command.event.value, result)
+            try:
+                await asyncio.wait_for(future, timeout=max(0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                raise CommandError(
+                    f"{command.endpoint.value} {command.data} was not confirmed "
+                    f"within {timeout} seconds"
+                )
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._waiters[key]
 
     async def test_connection(self, timeout: float = 5.0) -> bool:
         """Test HTTP connection to the controller. Returns True if successful, False otherwise."""
@@ -491,6 +1002,27 @@ class NjsPCClient:
         """Return True if the client is currently connected."""
         return self._connected
 
+    @property
+    def state_is_stale(self) -> bool:
+        """Return True if the known state may be outdated.
+
+        This is the case after loading a snapshot or losing the connection,
+        until the next successful :meth:`fetch_full_state`.
+        """
+        return self._stale
+
+    @property
+    def snapshot_age(self) -> Optional[float]:
+        """Return the age in seconds of the loaded snapshot, or None if none was loaded."""
+        if self._snapshot_saved_at is None:
+            return None
+        return time.time() - self._snapshot_saved_at
+
+    @property
+    def config(self) -> Optional[Dict[str, Any]]:
+        """Return the last fetched (or snapshotted) controller config, if any."""
+        return self._config
+
 
 if __name__ == "__main__":
     print("This module is not meant to be run directly.")
@@ -10,11 +10,30 @@ DEFAULT_MAX_RECONNECT_ATTEMPTS = 5
 DEFAULT_WATCHDOG_TIMEOUT = 60
 DEFAULT_FALLBACK_WATCHDOG_SLEEP = 10
 DEFAULT_UNKNOWN_EVENTS_LOG = None
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.2
+DEFAULT_RETRY_MAX_DELAY = 2.0
+DEFAULT_HEDGE_DELAY = None
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_RECOVERY_TIMEOUT = 30.0
+DEFAULT_SNAPSHOT_PATH = None
+DEFAULT_SNAPSHOT_INTERVAL = 60.0
+DEFAULT_SNAPSHOT_MAX_AGE = 86400.0
+
+# Default parameters for TelemetryAggregator
+DEFAULT_STATS_WINDOWS = (60.0, 900.0, 86400.0)
+DEFAULT_STATS_CAPACITY = 16384
+DEFAULT_STATS_QUANTILES = (0.5, 0.9, 0.99)
+DEFAULT_STATS_RELATIVE_ACCURACY = 0.01
+
+# Default parameters for NjsPCClient.apply
+DEFAULT_APPLY_CONCURRENCY = 4
 
 class ApiEndpoints(Enum):
     """API endpoint routes for nodejs-PoolController."""
     STATE_ALL = "state/all"
     STATE_STATUS = "state/status"
+    CONFIG_ALL = "config/all"
     CIRCUIT_SETSTATE = "state/circuit/setState"
     CIRCUITGROUP_SETSTATE = "state/circuitGroup/setState"
     LIGHTGROUP_SETSTATE = "state/lightGroup/setState"
@@ -58,7 +77,29 @@ class SocketIOEventsInbound(Enum):
     def is_known_event(event_name: str) -> bool:
         """Check if the event name is a known Socket.IO event."""
         return event_name in [event.value for event in SocketIOEventsInbound]
-    
+
+
+# Telemetry fields aggregated by TelemetryAggregator, as dotted paths per event
+DEFAULT_STATS_METRICS = {
+    SocketIOEventsInbound.TEMPS: ("waterSensor1", "waterSensor2", "air", "solar"),
+    SocketIOEventsInbound.PUMP: ("watts", "rpm", "flow"),
+    SocketIOEventsInbound.CHEM_CONTROLLER: ("ph.level", "orp.level"),
+}
+
+# Entity collections of the state/all payload and the event that updates them
+STATE_COLLECTIONS = {
+    "circuits": SocketIOEventsInbound.CIRCUIT,
+    "features": SocketIOEventsInbound.FEATURE,
+    "pumps": SocketIOEventsInbound.PUMP,
+    "chlorinators": SocketIOEventsInbound.CHLORINATOR,
+    "chemControllers": SocketIOEventsInbound.CHEM_CONTROLLER,
+    "filters": SocketIOEventsInbound.FILTER,
+    "lightGroups": SocketIOEventsInbound.LIGHTGROUP,
+    "circuitGroups": SocketIOEventsInbound.CIRCUITGROUP,
+    "virtualCircuits": SocketIOEventsInbound.VIRTUAL_CIRCUIT,
+    "schedules": SocketIOEventsInbound.SCHEDULE,
+}
+
 
 # class SocketIOEventsOutbound(Enum):
 #     """Socket.IO outbound event names for nodejs-PoolController."""
@@ -0,0 +1,137 @@
+"""Translate a declarative desired state into the minimal set of njsPC commands."""
+
+from typing import Any, Callable, Dict, Hashable, List, Mapping, NamedTuple, Optional
+
+from .changes import get_path
+from .const import ApiEndpoints, SocketIOEventsInbound
+
+# Desired-state sections holding on/off entities: (event, setState endpoint)
+_TOGGLE_SECTIONS = {
+    "circuits": (SocketIOEventsInbound.CIRCUIT, ApiEndpoints.CIRCUIT_SETSTATE),
+    "features": (SocketIOEventsInbound.FEATURE, ApiEndpoints.FEATURE_SETSTATE),
+    "lightGroups": (SocketIOEventsInbound.LIGHTGROUP, ApiEndpoints.LIGHTGROUP_SETSTATE),
+    "circuitGroups": (
+        SocketIOEventsInbound.CIRCUITGROUP,
+        ApiEndpoints.CIRCUITGROUP_SETSTATE,
+    ),
+}
+
+# Body settings: setting name -> (endpoint, payload key, state field)
+_BODY_SETTINGS = {
+    "setPoint": (ApiEndpoints.TEMPERATURE_SETPOINT, "setPoint", "setPoint"),
+    "heatMode": (ApiEndpoints.SET_HEATMODE, "mode", "heatMode.val"),
+}
+
+
+def normalize_entity_id(entity_id: Hashable) -> Hashable:
+    """Return ``entity_id`` as njsPC reports it: digit strings become ints.
+
+    Desired states loaded from JSON or YAML have string keys, while entity
+    payloads carry integer ids.
+    """
+    if isinstance(entity_id, str) and entity_id.strip().isdigit():
+        return int(entity_id)
+    return entity_id
+
+
+class PlannedCommand(NamedTuple):
+    """A command needed to reach the desired state, and how to confirm it."""
+
+    endpoint: ApiEndpoints
+    data: Dict[str, Any]
+    event: SocketIOEventsInbound
+    entity_id: Hashable
+    field: str  # dotted path of the state field the command changes
+    value: Any  # value of that field once the command has taken effect
+
+    def is_satisfied_by(self, entity: Optional[Dict[str, Any]]) -> bool:
+        """Return True if an entity payload already has the target value."""
+        return entity is not None and get_path(entity, self.field) == self.value
+
+
+def plan_commands(
+    desired_state: Mapping[str, Mapping[Hashable, Any]],
+    lookup: Callable[[SocketIOEventsInbound, Hashable], Optional[Dict[str, Any]]],
+) -> List[PlannedCommand]:
+    """Return the commands needed to move the current state to ``desired_state``.
+
+    ``desired_state`` maps sections to entities by id::
+
+        {
+            "circuits": {6: True, 2: {"isOn": True, "lightingTheme": 177}},
+            "features": {129: False},
+            "lightGroups": {192: True},
+            "circuitGroups": {193: False},
+            "bodies": {2: {"setPoint": 102, "heatMode": 1}},
+        }
+
+    Entity ids may also be given as digit strings (e.g. ``"6"``), as in
+    scenes loaded from JSON. ``lookup`` returns the current payload of an
+    entity, or None if unknown.
+    Settings the current state already satisfies are left out; unknown
+    entities are always commanded. Raises ValueError for unsupported or
+    malformed sections and settings.
+    """
+    commands: List[PlannedCommand] = []
+    for section, entities in desired_state.items():
+        if not isinstance(entities, Mapping):
+            raise ValueError(f"Desired state for {section} must map entity ids to settings")
+        if section in _TOGGLE_SECTIONS:
+            event, endpoint = _TOGGLE_SECTIONS[section]
+            for entity_id, target in entities.items():
+                entity_id = normalize_entity_id(entity_id)
+                settings = target if isinstance(target, Mapping) else {"isOn": target}
+                for name, value in settings.items():
+                    if name == "isOn":
+                        commands.append(
+                            PlannedCommand(
+                                endpoint,
+                                {"id": entity_id, "state": bool(value)},
+                                event,
+                                entity_id,
+                                "isOn",
+                                bool(value),
+                            )
+                        )
+                    elif name == "lightingTheme" and section == "circuits":
+                        commands.append(
+                            PlannedCommand(
+                                ApiEndpoints.CIRCUIT_SETTHEME,
+                                {"id": entity_id, "theme": value},
+                                event,
+                                entity_id,
+                                "lightingTheme.val",
+                                value,
+                            )
+                        )
+                    else:
+                        raise ValueError(f"Unsupported setting '{name}' for {section}")
+        elif section == "bodies":
+            for entity_id, settings in entities.items():
+                entity_id = normalize_entity_id(entity_id)
+                if not isinstance(settings, Mapping):
+                    raise ValueError(
+                        f"Desired state for body {entity_id} must map settings to values"
+                    )
+                for name, value in settings.items():
+                    if name not in _BODY_SETTINGS:
+                        raise ValueError(f"Unsupported setting '{name}' for bodies")
+                    endpoint, key, field = _BODY_SETTINGS[name]
+                    commands.append(
+                        PlannedCommand(
+                            endpoint,
+                            {"id": entity_id, key: value},
+                            SocketIOEventsInbound.BODY,
+                            entity_id,
+                            field,
+                            value,
+                        )
+                    )
+        else:
+            raise ValueError(f"Unsupported desired state section '{section}'")
+
+    return [
+        command
+        for command in commands
+        if not command.is_satisfied_by(lookup(command.event, command.entity_id))
+    ]
@@ -12,6 +12,14 @@ class ConnectionTimeoutError(ConnectionError):
     """Raised when a connection attempt times out."""
     pass
 
+class CircuitOpenError(ConnectionError):
+    """Raised when a request is rejected because the controller's circuit breaker is open."""
+    pass
+
 class NotConnectedError(NjsPCError):
     """Raised when an operation is attempted before the client is connected."""
     pass
+
+class CommandError(NjsPCError):
+    """Raised when a command to the equipment fails."""
+    pass
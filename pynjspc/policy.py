@@ -0,0 +1,137 @@
+"""Retry and circuit breaker policies for njsPC HTTP requests."""
+
+import random
+import time
+from enum import Enum
+from typing import Optional
+
+from .const import (
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_BASE_DELAY,
+    DEFAULT_RETRY_MAX_DELAY,
+)
+
+
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff.
+
+    Only idempotent requests are retried. The delay before retry ``n``
+    (starting at 0) is drawn uniformly from
+    ``[0, min(max_delay, base_delay * 2 ** n)]`` so that clients hitting a
+    degraded controller do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+    ):
+        self.attempts: int = max(
+            1, int(attempts if attempts is not None else DEFAULT_RETRY_ATTEMPTS)
+        )
+        self.base_delay: float = float(
+            base_delay if base_delay is not None else DEFAULT_RETRY_BASE_DELAY
+        )
+        self.max_delay: float = float(
+            max_delay if max_delay is not None else DEFAULT_RETRY_MAX_DELAY
+        )
+
+    def backoff(self, retry: int) -> float:
+        """Return the delay in seconds before retry number ``retry``."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+class CircuitBreakerState(Enum):
+    """States of a :class:`CircuitBreaker`."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding requests to one controller.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    requests fail fast. Once ``recovery_timeout`` seconds have passed it turns
+    half-open and lets a single probe request through: success closes the
+    breaker, failure opens it again. If the probe never reports back, another
+    probe is allowed after a further ``recovery_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        recovery_timeout: Optional[float] = None,
+    ):
+        self.failure_threshold: int = max(
+            1,
+            int(
+                failure_threshold
+                if failure_threshold is not None
+                else DEFAULT_BREAKER_FAILURE_THRESHOLD
+            ),
+        )
+        self.recovery_timeout: float = float(
+            recovery_timeout
+            if recovery_timeout is not None
+            else DEFAULT_BREAKER_RECOVERY_TIMEOUT
+        )
+        self._state: CircuitBreakerState = CircuitBreakerState.CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0.0
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        """Return the current state, moving from open to half-open when due."""
+        if (
+            self._state is CircuitBreakerState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitBreakerState.HALF_OPEN
+            self._opened_at = time.monotonic() - self.recovery_timeout
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures recorded."""
+        return self._failures
+
+    @property
+    def retry_after(self) -> float:
+        """Return the seconds until the next request will be allowed."""
+        if self.state is CircuitBreakerState.CLOSED:
+            return 0.0
+        return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state is CircuitBreakerState.CLOSED:
+            return True
+        if state is CircuitBreakerState.HALF_OPEN and self.retry_after == 0:
+            # Let one probe through; the next one waits another recovery period
+            self._opened_at = time.monotonic()
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request and close the breaker."""
+        self._failures = 0
+        self._state = CircuitBreakerState.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker if needed."""
+        self._failures += 1
+        if (
+            self._state is CircuitBreakerState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            self._state = CircuitBreakerState.OPEN
+            self._opened_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Close the breaker and forget past failures."""
+        self.record_success()
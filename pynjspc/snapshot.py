@@ -0,0 +1,57 @@
+"""Compact on-disk snapshots of the last known controller state."""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot(path: Union[str, Path], snapshot: Dict[str, Any]) -> None:
+    """Atomically write a snapshot as gzip-compressed compact JSON.
+
+    The snapshot is written to a temporary file in the same directory and
+    moved over ``path``, so readers never see a partially written file.
+    """
+    path = Path(path)
+    payload = json.dumps(
+        {"version": SNAPSHOT_VERSION, **snapshot}, separators=(",", ":")
+    ).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(gzip.compress(payload, mtime=0))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_snapshot(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """Read a snapshot written by :func:`write_snapshot`.
+
+    Returns None if the file does not exist or cannot be used.
+    """
+    try:
+        with gzip.open(path, "rb") as f:
+            snapshot = json.loads(f.read().decode("utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        _LOGGER.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        _LOGGER.warning(f"Ignoring snapshot {path} with unsupported format")
+        return None
+    return snapshot
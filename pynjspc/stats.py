@@ -0,0 +1,333 @@
+"""Incremental rolling statistics over njsPC telemetry events."""
+
+import math
+import time
+from array import array
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .changes import entity_id_of, entity_path, get_path
+from .const import (
+    DEFAULT_STATS_CAPACITY,
+    DEFAULT_STATS_METRICS,
+    DEFAULT_STATS_QUANTILES,
+    DEFAULT_STATS_RELATIVE_ACCURACY,
+    DEFAULT_STATS_WINDOWS,
+    SocketIOEventsInbound,
+)
+
+if TYPE_CHECKING:
+    from .client import NjsPCClient
+
+
+class QuantileSketch:
+    """Approximate quantile sketch with logarithmic buckets.
+
+    Every value is counted in a bucket whose bounds are within
+    ``relative_accuracy`` of each other, so quantiles are returned with that
+    relative error. Values can be removed again, which makes the sketch
+    usable over a sliding window. Adding and removing are O(1).
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_STATS_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Count a value."""
+        self.count += 1
+        if value > 0:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < 0:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self._zero += 1
+
+    def remove(self, value: float) -> None:
+        """Uncount a value previously passed to :meth:`add`."""
+        self.count -= 1
+        if value == 0:
+            self._zero -= 1
+            return
+        buckets = self._positive if value > 0 else self._negative
+        key = self._key(abs(value))
+        remaining = buckets[key] - 1
+        if remaining:
+            buckets[key] = remaining
+        else:
+            del buckets[key]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the approximate ``q`` quantile (0 <= q <= 1), or None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+
+class _Window:
+    """Running aggregates over the samples of one time window."""
+
+    def __init__(self, span: float, relative_accuracy: float):
+        self.span = span
+        self.start = 0  # sequence number of the oldest sample in the window
+        # True while samples younger than the span were dropped for capacity
+        self.truncated = False
+        self.total = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+        # Monotonic queues of (sequence, value) for O(1) amortized min/max
+        self.mins: Deque[Tuple[int, float]] = deque()
+        self.maxs: Deque[Tuple[int, float]] = deque()
+
+    def add(self, seq: int, value: float) -> None:
+        self.total += value
+        self.sketch.add(value)
+        while self.mins and self.mins[-1][1] >= value:
+            self.mins.pop()
+        self.mins.append((seq, value))
+        while self.maxs and self.maxs[-1][1] <= value:
+            self.maxs.pop()
+        self.maxs.append((seq, value))
+
+    def evict(self, value: float) -> None:
+        """Drop the oldest sample of the window, whose value is ``value``."""
+        self.sketch.remove(value)
+        self.total = self.total - value if self.sketch.count else 0.0
+        if self.mins and self.mins[0][0] == self.start:
+            self.mins.popleft()
+        if self.maxs and self.maxs[0][0] == self.start:
+            self.maxs.popleft()
+        self.start += 1
+
+
+class RollingStatistics:
+    """Rolling statistics of one numeric series over several time windows.
+
+    Samples are kept once in array-backed ring buffers shared by all windows;
+    each window only tracks where it starts in the ring and its running
+    aggregates. When the ring is full the oldest sample is dropped from every
+    window still holding it, so ``capacity`` bounds memory regardless of the
+    window spans. A window that lost samples this way reports
+    ``truncated=True`` and a ``coverage`` shorter than its span; size
+    ``capacity`` to at least the largest span divided by the sample interval
+    to avoid it.
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[float] = DEFAULT_STATS_WINDOWS,
+        capacity: int = DEFAULT_STATS_CAPACITY,
+        quantiles: Sequence[float] = DEFAULT_STATS_QUANTILES,
+        relative_accuracy: float = DEFAULT_STATS_RELATIVE_ACCURACY,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = int(capacity)
+        self._times = array("d", bytes(8 * self._capacity))
+        self._values = array("d", bytes(8 * self._capacity))
+        self._next = 0  # sequence number of the next sample
+        self._quantiles = tuple(quantiles)
+        self._windows = [
+            _Window(float(span), relative_accuracy) for span in sorted(windows)
+        ]
+
+    def add(self, value: float, now: Optional[float] = None) -> None:
+        """Add a sample taken at monotonic time ``now``. Non-finite values are ignored."""
+        if not math.isfinite(value):
+            return
+        if now is None:
+            now = time.monotonic()
+        # Expire first so only samples still inside a window count as truncation
+        self._expire(now)
+        oldest = self._next - self._capacity
+        if oldest >= 0:
+            value_out = self._values[oldest % self._capacity]
+            for window in self._windows:
+                if window.start == oldest:
+                    window.evict(value_out)
+                    window.truncated = True
+        index = self._next % self._capacity
+        self._times[index] = now
+        self._values[index] = value
+        for window in self._windows:
+            window.add(self._next, value)
+        self._next += 1
+
+    def _expire(self, now: float) -> None:
+        for window in self._windows:
+            cutoff = now - window.span
+            while (
+                window.start < self._next
+                and self._times[window.start % self._capacity] <= cutoff
+            ):
+                window.evict(self._values[window.start % self._capacity])
+                window.truncated = False
+
+    def statistics(self, now: Optional[float] = None) -> Dict[float, Dict[str, Any]]:
+        """Return count, min, max, mean and quantiles for every window span.
+
+        Each window also reports ``coverage``, the age in seconds of its
+        oldest sample, and ``truncated``, True if the ring buffer was too
+        small to hold the whole span.
+        """
+        if now is None:
+            now = time.monotonic()
+        self._expire(now)
+        result: Dict[float, Dict[str, Any]] = {}
+        for window in self._windows:
+            count = window.sketch.count
+            stats: Dict[str, Any] = {
+                "count": count,
+                "min": window.mins[0][1] if count else None,
+                "max": window.maxs[0][1] if count else None,
+                "mean": window.total / count if count else None,
+                "coverage": (
+                    now - self._times[window.start % self._capacity] if count else 0.0
+                ),
+                "truncated": window.truncated,
+            }
+            for q in self._quantiles:
+                value = window.sketch.quantile(q)
+                if value is not None:
+                    # Bucket midpoints may fall just outside the exact range
+                    value = min(max(value, stats["min"]), stats["max"])
+                stats[f"p{q * 100:g}"] = value
+            result[window.span] = stats
+        return result
+
+
+class TelemetryAggregator:
+    """Rolling statistics for telemetry fields of njsPC event streams.
+
+    By default water/air temperatures, pump watts/rpm/flow and chemController
+    pH/ORP levels are aggregated over 1 minute, 15 minute and 24 hour windows.
+    Series are keyed by change path, e.g. ``pump[1].watts`` or
+    ``temps.waterSensor1``.
+
+    Each series keeps at most ``capacity`` samples. Pass ``sample_interval``
+    (the expected seconds between events) instead to size it so the largest
+    window is fully covered; check ``truncated`` and ``coverage`` in the
+    statistics to detect windows cut short.
+
+    Usage::
+
+        aggregator = TelemetryAggregator()
+        aggregator.attach(client)
+        ...
+        aggregator.statistics()["pump[1].watts"][900.0]["p90"]
+    """
+
+    def __init__(
+        self,
+        metrics: Optional[Mapping[SocketIOEventsInbound, Iterable[str]]] = None,
+        *,
+        windows: Optional[Sequence[float]] = None,
+        capacity: Optional[int] = None,
+        sample_interval: Optional[float] = None,
+        quantiles: Optional[Sequence[float]] = None,
+        relative_accuracy: Optional[float] = None,
+    ):
+        self._metrics: Dict[str, Tuple[str, ...]] = {
+            event.value: tuple(fields)
+            for event, fields in (metrics or DEFAULT_STATS_METRICS).items()
+        }
+        self._windows = tuple(windows or DEFAULT_STATS_WINDOWS)
+        if capacity is None and sample_interval:
+            capacity = math.ceil(max(self._windows) / sample_interval) + 1
+        self._capacity = int(capacity or DEFAULT_STATS_CAPACITY)
+        self._quantiles = tuple(quantiles or DEFAULT_STATS_QUANTILES)
+        self._relative_accuracy = float(
+            relative_accuracy or DEFAULT_STATS_RELATIVE_ACCURACY
+        )
+        self._series: Dict[str, RollingStatistics] = {}
+        self._handlers: List[Tuple["NjsPCClient", SocketIOEventsInbound, Callable]] = []
+
+    def attach(self, client: "NjsPCClient") -> None:
+        """Start aggregating the configured event streams of a client."""
+        for event_name in self._metrics:
+            event = SocketIOEventsInbound(event_name)
+
+            def handler(data: Any, event_name: str = event_name) -> None:
+                self.add(event_name, data)
+
+            client.on(event, handler)
+            self._handlers.append((client, event, handler))
+
+    def detach(self) -> None:
+        """Stop aggregating events of all attached clients."""
+        for client, event, handler in self._handlers:
+            client.off(event, handler)
+        self._handlers.clear()
+
+    def add(self, event: str, data: Any, now: Optional[float] = None) -> None:
+        """Add the numeric telemetry fields of an event payload."""
+        fields = self._metrics.get(event)
+        if not fields or not isinstance(data, dict):
+            return
+        if now is None:
+            now = time.monotonic()
+        root = entity_path(event, entity_id_of(data))
+        for field in fields:
+            value = get_path(data, field)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            if not math.isfinite(value):
+                continue
+            path = f"{root}.{field}"
+            series = self._series.get(path)
+            if series is None:
+                series = self._series[path] = RollingStatistics(
+                    self._windows,
+                    self._capacity,
+                    self._quantiles,
+                    self._relative_accuracy,
+                )
+            series.add(float(value), now)
+
+    def statistics(
+        self, now: Optional[float] = None
+    ) -> Dict[str, Dict[float, Dict[str, Any]]]:
+        """Return the current window statistics of every series, keyed by path."""
+        return {path: series.statistics(now) for path, series in self._series.items()}
+
+    def series(self, path: str) -> Optional[RollingStatistics]:
+        """Return the rolling statistics of one series, or None if never seen."""
+        return self._series.get(path)
@@ -0,0 +1,80 @@
+"""Tests for NjsPCClient.apply."""
+
+import pytest
+
+from pynjspc import NjsPCClient
+
+
+def make_client(controller_state):
+    """Return a connected client whose HTTP calls hit ``controller_state``."""
+    client = NjsPCClient(auto_reconnect=False)
+    client._connected = True
+    sent = []
+    fetches = []
+
+    async def fetch_full_state(timeout=None):
+        state = {
+            "circuits": [dict(c) for c in controller_state["circuits"].values()],
+        }
+        fetches.append(state)
+        client._ingest_state(state)
+        client._stale = False
+        return state
+
+    async def send_command(endpoint, data=None, method="PUT", timeout=None, idempotent=None):
+        sent.append((endpoint.value, data))
+        circuit = controller_state["circuits"][data["id"]]
+        circuit["isOn"] = data["state"]
+        return dict(circuit)
+
+    client.fetch_full_state = fetch_full_state
+    client.send_command = send_command
+    return client, sent, fetches
+
+
+@pytest.mark.asyncio
+async def test_apply_sends_only_needed_commands():
+    controller = {"circuits": {1: {"id": 1, "isOn": True}, 6: {"id": 6, "isOn": False}}}
+    client, sent, fetches = make_client(controller)
+
+    commands = await client.apply({"circuits": {1: True, 6: True}}, timeout=1)
+
+    assert len(fetches) == 1
+    assert sent == [("state/circuit/setState", {"id": 6, "state": True})]
+    assert [command.entity_id for command in commands] == [6]
+    assert await client.apply({"circuits": {1: True, 6: True}}, timeout=1) == []
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_apply_refetches_state_after_reconnect():
+    controller = {"circuits": {6: {"id": 6, "isOn": False}}}
+    client, sent, fetches = make_client(controller)
+    await client.fetch_full_state()
+
+    # The connection drops and the circuit is turned on while disconnected,
+    # so the cached state still says it is off.
+    await client._cleanup_socket()
+    controller["circuits"][6]["isOn"] = True
+    client._connected = True
+    assert client.state_is_stale
+
+    # Turning it off must not be skipped based on the outdated cache.
+    await client.apply({"circuits": {6: False}}, timeout=1)
+
+    assert len(fetches) == 2
+    assert sent == [("state/circuit/setState", {"id": 6, "state": False})]
+    assert controller["circuits"][6]["isOn"] is False
+    assert not client.state_is_stale
+
+
+@pytest.mark.asyncio
+async def test_apply_accepts_string_entity_ids():
+    controller = {"circuits": {6: {"id": 6, "isOn": False}}}
+    client, sent, fetches = make_client(controller)
+
+    await client.apply({"circuits": {"6": True}}, timeout=0.3)
+
+    assert sent == [("state/circuit/setState", {"id": 6, "state": True})]
+    assert await client.apply({"circuits": {"6": True}}, timeout=0.3) == []
+    assert len(sent) == 1
@@ -0,0 +1,114 @@
+"""Tests for field-level change detection."""
+
+from pynjspc import NjsPCClient, SocketIOEventsInbound
+from pynjspc.changes import ChangeTracker, parent_paths
+
+
+def test_parent_paths():
+    assert parent_paths("pump[1].status.val") == [
+        "pump",
+        "pump[1]",
+        "pump[1].status",
+        "pump[1].status.val",
+    ]
+    assert parent_paths("temps") == ["temps"]
+
+
+def test_field_subscription_fires_only_on_change():
+    tracker = ChangeTracker()
+    changes = []
+    tracker.subscribe("pump[1].watts", lambda *change: changes.append(change))
+
+    tracker.update("pump", {"id": 1, "rpm": 2000, "watts": 300})
+    tracker.update("pump", {"id": 1, "rpm": 2100, "watts": 300})
+    tracker.update("pump", {"id": 2, "rpm": 2100, "watts": 500})
+    tracker.update("pump", {"id": 1, "rpm": 2100, "watts": 310})
+
+    assert changes == [("pump[1].watts", None, 300), ("pump[1].watts", 300, 310)]
+
+
+def test_parent_subscription_receives_nested_changes():
+    tracker = ChangeTracker()
+    entity_changes = []
+    event_changes = []
+    tracker.subscribe("chemController[1]", lambda *c: entity_changes.append(c))
+    tracker.subscribe("chemController", lambda *c: event_changes.append(c))
+
+    tracker.update("chemController", {"id": 1, "ph": {"level": 7.4}})
+    tracker.update("chemController", {"id": 1, "ph": {"level": 7.5}})
+
+    assert entity_changes[-1] == ("chemController[1].ph.level", 7.4, 7.5)
+    assert event_changes == entity_changes
+
+
+def test_partial_payloads_are_merged():
+    tracker = ChangeTracker()
+    tracker.update("temps", {"waterSensor1": 80, "air": 70})
+    changes = tracker.update("temps", {"air": 71})
+
+    assert changes == [("temps.air", 70, 71)]
+    assert tracker.get("temps") == {"waterSensor1": 80, "air": 71}
+
+
+def test_unsubscribe_and_failing_callback():
+    tracker = ChangeTracker()
+    calls = []
+
+    def failing(*change):
+        raise RuntimeError("boom")
+
+    def callback(*change):
+        calls.append(change)
+
+    tracker.subscribe("temps.air", failing)
+    tracker.subscribe("temps.air", callback)
+    tracker.update("temps", {"air": 70})
+    tracker.unsubscribe("temps.air", callback)
+    tracker.update("temps", {"air": 71})
+
+    assert calls == [("temps.air", None, 70)]
+
+
+def test_client_dispatches_changes_from_events():
+    client = NjsPCClient(auto_reconnect=False)
+    changes = []
+    client.on_change("circuit[6].isOn", lambda *change: changes.append(change))
+
+    client._handle_event("circuit", {"id": 6, "isOn": False})
+    client._handle_event("circuit", {"id": 6, "isOn": False, "name": "Spa"})
+    client._handle_event("circuit", {"id": 6, "isOn": True})
+
+    assert changes == [("circuit[6].isOn", None, False), ("circuit[6].isOn", False, True)]
+    assert client.get_entity(SocketIOEventsInbound.CIRCUIT, 6) == {
+        "id": 6,
+        "isOn": True,
+        "name": "Spa",
+    }
+
+
+def test_entities_missing_from_full_state_are_reported_removed():
+    client = NjsPCClient(auto_reconnect=False)
+    client._ingest_state({"circuits": [{"id": 1, "isOn": True}, {"id": 6, "isOn": True}]})
+    changes = []
+    client.on_change("circuit[6]", lambda *change: changes.append(change))
+
+    client._ingest_state({"circuits": [{"id": 1, "isOn": True}]})
+
+    assert changes == [("circuit[6]", {"id": 6, "isOn": True}, None)]
+    assert client.get_entity(SocketIOEventsInbound.CIRCUIT, 6) is None
+    assert client.get_entity(SocketIOEventsInbound.CIRCUIT, 1) is not None
+
+
+def test_remove_without_event_clears_change_callbacks():
+    client = NjsPCClient(auto_reconnect=False)
+    changes = []
+    client.on_change("circuit[6].isOn", lambda *change: changes.append(change))
+    client._handle_event("circuit", {"id": 6, "isOn": False})
+
+    client.remove(SocketIOEventsInbound.CIRCUIT)
+    client._handle_event("circuit", {"id": 6, "isOn": True})
+    assert len(changes) == 2
+
+    client.remove()
+    client._handle_event("circuit", {"id": 6, "isOn": False})
+    assert len(changes) == 2
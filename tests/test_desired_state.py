@@ -0,0 +1,74 @@
+"""Tests for desired state planning."""
+
+import pytest
+
+from pynjspc.const import ApiEndpoints, SocketIOEventsInbound
+from pynjspc.desired_state import plan_commands
+
+CURRENT = {
+    ("circuit", 1): {"id": 1, "isOn": True, "lightingTheme": {"val": 177}},
+    ("circuit", 6): {"id": 6, "isOn": False},
+    ("feature", 129): {"id": 129, "isOn": False},
+    ("body", 2): {"id": 2, "setPoint": 102, "heatMode": {"val": 0}},
+}
+
+
+def lookup(event, entity_id):
+    return CURRENT.get((event.value, entity_id))
+
+
+def test_plan_skips_satisfied_settings():
+    commands = plan_commands(
+        {
+            "circuits": {1: {"isOn": True, "lightingTheme": 177}, 6: True},
+            "features": {129: False},
+            "bodies": {2: {"setPoint": 102, "heatMode": 1}},
+        },
+        lookup,
+    )
+
+    assert [(c.endpoint, c.data) for c in commands] == [
+        (ApiEndpoints.CIRCUIT_SETSTATE, {"id": 6, "state": True}),
+        (ApiEndpoints.SET_HEATMODE, {"id": 2, "mode": 1}),
+    ]
+    assert commands[1].event is SocketIOEventsInbound.BODY
+    assert commands[1].field == "heatMode.val"
+
+
+def test_plan_commands_unknown_entities():
+    commands = plan_commands({"lightGroups": {192: True}}, lookup)
+
+    assert [(c.endpoint, c.data) for c in commands] == [
+        (ApiEndpoints.LIGHTGROUP_SETSTATE, {"id": 192, "state": True}),
+    ]
+
+
+def test_plan_nothing_when_state_reached():
+    assert plan_commands({"circuits": {1: True, 6: False}}, lookup) == []
+
+
+@pytest.mark.parametrize(
+    "desired_state",
+    [
+        {"bodies": {2: 102}},
+        {"bodies": {2: {"temp": 80}}},
+        {"circuits": [1, 6]},
+        {"circuits": {1: {"speed": 3}}},
+        {"pumps": {1: True}},
+    ],
+)
+def test_plan_rejects_invalid_desired_state(desired_state):
+    with pytest.raises(ValueError):
+        plan_commands(desired_state, lookup)
+
+
+def test_plan_normalizes_string_entity_ids():
+    commands = plan_commands(
+        {"circuits": {"1": True, "6": True}, "bodies": {"2": {"setPoint": 104}}},
+        lookup,
+    )
+
+    assert [(c.data, c.entity_id) for c in commands] == [
+        ({"id": 6, "state": True}, 6),
+        ({"id": 2, "setPoint": 104}, 2),
+    ]
@@ -0,0 +1,77 @@
+"""Tests for the retry and circuit breaker policies."""
+
+import pytest
+
+import pynjspc.policy
+from pynjspc.policy import CircuitBreaker, CircuitBreakerState, RetryPolicy
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pynjspc.policy.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_breaker_transitions(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+    assert breaker.state is CircuitBreakerState.CLOSED
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state is CircuitBreakerState.CLOSED
+    breaker.record_failure()
+    assert breaker.state is CircuitBreakerState.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after == 30
+
+    clock[0] += 30
+    assert breaker.state is CircuitBreakerState.HALF_OPEN
+    assert breaker.allow()
+    # Only one probe at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state is CircuitBreakerState.CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_failed_probe_reopens_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure()
+    clock[0] += 10
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitBreakerState.OPEN
+    assert not breaker.allow()
+    clock[0] += 10
+    assert breaker.allow()
+
+
+def test_lost_probe_is_replaced_after_recovery_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+    breaker.record_failure()
+    clock[0] += 10
+    assert breaker.allow()
+    clock[0] += 5
+    assert not breaker.allow()
+    clock[0] += 5
+    assert breaker.allow()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitBreakerState.CLOSED
+
+
+def test_retry_backoff_is_bounded():
+    policy = RetryPolicy(attempts=4, base_delay=0.5, max_delay=2.0)
+    for retry, cap in enumerate([0.5, 1.0, 2.0, 2.0]):
+        assert all(0 <= policy.backoff(retry) <= cap for _ in range(100))
+    assert RetryPolicy(attempts=0).attempts == 1
@@ -0,0 +1,150 @@
+"""Tests for the retry, hedging and circuit breaker handling of NjsPCClient."""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from pynjspc import (
+    ApiEndpoints,
+    CircuitBreaker,
+    CircuitBreakerState,
+    CircuitOpenError,
+    ConnectionTimeoutError,
+    NjsPCClient,
+    RetryPolicy,
+)
+from pynjspc.exceptions import ConnectionError as NjsPCConnectionError
+
+
+def make_client(attempt, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(attempts=3, base_delay=0, max_delay=0))
+    client = NjsPCClient(auto_reconnect=False, **kwargs)
+    client._connected = True
+    client._get_host_url = lambda port=None: "http://192.0.2.1:4200"
+    client._attempt = attempt
+    return client
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_command_is_sent_once():
+    calls = []
+
+    async def attempt(method, url, data, deadline):
+        calls.append(method)
+        raise aiohttp.ClientError("connection reset")
+
+    client = make_client(attempt)
+    with pytest.raises(NjsPCConnectionError):
+        await client.send_command(ApiEndpoints.CIRCUIT_SETSTATE, {"id": 6, "state": True})
+    assert calls == ["PUT"]
+
+
+@pytest.mark.asyncio
+async def test_idempotent_request_is_retried_until_success():
+    calls = []
+
+    async def attempt(method, url, data, deadline):
+        calls.append(method)
+        if len(calls) == 1:
+            raise asyncio.TimeoutError()
+        if len(calls) == 2:
+            return 503, "busy"
+        return 200, '{"circuits": []}'
+
+    client = make_client(attempt)
+    assert await client.fetch_full_state() == {"circuits": []}
+    assert calls == ["GET", "GET", "GET"]
+    assert client.circuit_breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_a_deadline_across_retries():
+    calls = []
+
+    async def attempt(method, url, data, deadline):
+        calls.append(method)
+        await asyncio.sleep(0.08)
+        raise asyncio.TimeoutError()
+
+    client = make_client(attempt, retry_policy=RetryPolicy(attempts=5, base_delay=0))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(ConnectionTimeoutError):
+        await client.fetch_full_state(timeout=0.1)
+    assert loop.time() - start < 0.3
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast():
+    calls = []
+
+    async def attempt(method, url, data, deadline):
+        calls.append(method)
+        raise aiohttp.ClientError("unreachable")
+
+    client = make_client(attempt, circuit_breaker=CircuitBreaker(failure_threshold=2))
+    # The breaker opening mid-call surfaces the real error, not CircuitOpenError
+    with pytest.raises(NjsPCConnectionError) as excinfo:
+        await client.fetch_full_state()
+    assert not isinstance(excinfo.value, CircuitOpenError)
+    assert client.breaker_state is CircuitBreakerState.OPEN
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        await client.fetch_full_state()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_get_uses_first_response():
+    calls = []
+
+    async def attempt(method, url, data, deadline):
+        calls.append(url)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return 200, "{}"
+
+    client = make_client(attempt, hedge_delay=0.01)
+    assert await asyncio.wait_for(client.fetch_full_state(), 1) == {}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_hedged_get_cancels_requests():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def attempt(method, url, data, deadline):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return 200, "{}"
+
+    client = make_client(attempt, hedge_delay=5)
+    task = asyncio.ensure_future(client.fetch_full_state())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+    assert len(cancelled) == 1
+
+
+@pytest.mark.asyncio
+async def test_breaker_opening_mid_call_returns_last_response():
+    calls = []
+
+    async def attempt(method, url, data, deadline):
+        calls.append(method)
+        return 503, "busy"
+
+    client = make_client(attempt, circuit_breaker=CircuitBreaker(failure_threshold=2))
+    response = await client._request("GET", "http://192.0.2.1:4200/state/all", timeout=1)
+    assert response == (503, "busy")
+    assert len(calls) == 2
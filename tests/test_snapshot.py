@@ -0,0 +1,146 @@
+"""Tests for warm-start snapshots."""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+import pynjspc.client
+from pynjspc import NjsPCClient, SocketIOEventsInbound
+from pynjspc.snapshot import read_snapshot, write_snapshot
+
+
+def test_write_and_read_snapshot(tmp_path):
+    path = tmp_path / "state.json.gz"
+    write_snapshot(path, {"entities": {"circuit": [{"id": 6, "isOn": True}]}})
+
+    assert read_snapshot(path) == {
+        "version": 1,
+        "entities": {"circuit": [{"id": 6, "isOn": True}]},
+    }
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json.gz"]
+
+
+def test_read_snapshot_ignores_missing_and_invalid_files(tmp_path):
+    assert read_snapshot(tmp_path / "missing") is None
+    (tmp_path / "garbage").write_bytes(b"not gzip")
+    assert read_snapshot(tmp_path / "garbage") is None
+    (tmp_path / "other").write_bytes(gzip.compress(json.dumps({"version": 99}).encode()))
+    assert read_snapshot(tmp_path / "other") is None
+
+
+@pytest.mark.asyncio
+async def test_client_snapshot_round_trip(tmp_path):
+    path = tmp_path / "state.json.gz"
+    client = NjsPCClient("pool", 4200, snapshot_path=path)
+    client._ingest_state({"circuits": [{"id": 6, "isOn": True}]})
+    client._handle_event("pump", {"id": 1, "watts": 300})
+    await client.save_snapshot()
+
+    restored = NjsPCClient("pool", 4200, snapshot_path=path)
+    changes = []
+    restored.on_change("pump[1].watts", lambda *change: changes.append(change))
+    assert await restored.load_snapshot()
+
+    assert restored.state_is_stale
+    assert restored.snapshot_age is not None and restored.snapshot_age < 5
+    assert restored.get_entity(SocketIOEventsInbound.CIRCUIT, 6) == {"id": 6, "isOn": True}
+    assert changes == [("pump[1].watts", None, 300)]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_of_other_controller_is_ignored(tmp_path):
+    path = tmp_path / "state.json.gz"
+    client = NjsPCClient("pool", 4200, snapshot_path=path)
+    client._handle_event("pump", {"id": 1, "watts": 300})
+    await client.save_snapshot()
+
+    other = NjsPCClient("spa", 4200, snapshot_path=path)
+    assert not await other.load_snapshot()
+    assert other.get_entity(SocketIOEventsInbound.PUMP, 1) is None
+    assert not other.state_is_stale
+
+
+@pytest.mark.asyncio
+async def test_old_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "state.json.gz"
+    write_snapshot(
+        path,
+        {
+            "host": "pool",
+            "port": 4200,
+            "savedAt": time.time() - 7200,
+            "entities": {"pump": [{"id": 1, "watts": 300}]},
+        },
+    )
+
+    strict = NjsPCClient("pool", 4200, snapshot_path=path, snapshot_max_age=3600)
+    assert not await strict.load_snapshot()
+    lenient = NjsPCClient("pool", 4200, snapshot_path=path, snapshot_max_age=10800)
+    assert await lenient.load_snapshot()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_save_does_not_overwrite_newer_snapshot(tmp_path, monkeypatch):
+    path = tmp_path / "state.json.gz"
+    release = threading.Event()
+    first_written = threading.Event()
+
+    def slow_write(path, snapshot):
+        if snapshot["entities"]["pump"][0]["watts"] == 300:
+            release.wait(5)
+            write_snapshot(path, snapshot)
+            first_written.set()
+        else:
+            write_snapshot(path, snapshot)
+
+    monkeypatch.setattr(pynjspc.client, "write_snapshot", slow_write)
+    client = NjsPCClient("pool", 4200, snapshot_path=path)
+    client._handle_event("pump", {"id": 1, "watts": 300})
+    first = asyncio.ensure_future(client.save_snapshot())
+    await asyncio.sleep(0.05)
+    first.cancel()
+
+    client._handle_event("pump", {"id": 1, "watts": 310})
+    second = asyncio.ensure_future(client.save_snapshot())
+    await asyncio.sleep(0.05)
+    release.set()
+    await second
+    assert first_written.wait(5)
+
+    assert read_snapshot(path)["entities"]["pump"] == [{"id": 1, "watts": 310}]
+
+
+@pytest.mark.asyncio
+async def test_failed_write_of_cancelled_save_keeps_state_dirty(tmp_path, monkeypatch):
+    path = tmp_path / "state.json.gz"
+    release = threading.Event()
+
+    def failing_write(path, snapshot):
+        release.wait(5)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pynjspc.client, "write_snapshot", failing_write)
+    client = NjsPCClient("pool", 4200, snapshot_path=path)
+    client._handle_event("pump", {"id": 1, "watts": 300})
+    save = asyncio.ensure_future(client.save_snapshot())
+    await asyncio.sleep(0.05)
+    save.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await save
+
+    write = client._snapshot_write
+    release.set()
+    await asyncio.wait({write})
+    await asyncio.sleep(0)
+
+    assert client._snapshot_dirty
+    assert client._snapshot_write is None
+
+    # The final save on disconnect retries the lost state
+    monkeypatch.setattr(pynjspc.client, "write_snapshot", write_snapshot)
+    await client._stop_snapshot_task()
+    assert read_snapshot(path)["entities"]["pump"] == [{"id": 1, "watts": 300}]
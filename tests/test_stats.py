@@ -0,0 +1,131 @@
+"""Tests for rolling telemetry statistics."""
+
+import random
+
+import pytest
+
+from pynjspc.stats import QuantileSketch, RollingStatistics, TelemetryAggregator
+
+
+def test_quantile_sketch_relative_accuracy():
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    values = [float(v) for v in range(1, 1001)]
+    for value in values:
+        sketch.add(value)
+    assert sketch.quantile(0.5) == pytest.approx(500, rel=0.02)
+    assert sketch.quantile(0.99) == pytest.approx(990, rel=0.02)
+
+    for value in values[:900]:
+        sketch.remove(value)
+    assert sketch.count == 100
+    assert sketch.quantile(0.0) == pytest.approx(901, rel=0.02)
+
+
+def test_quantile_sketch_negative_and_zero():
+    sketch = QuantileSketch()
+    for value in (-10.0, 0.0, 0.0, 10.0):
+        sketch.add(value)
+    assert sketch.quantile(0.0) == pytest.approx(-10, rel=0.02)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1.0) == pytest.approx(10, rel=0.02)
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_windows_evict_expired_samples():
+    series = RollingStatistics(windows=(10, 100), capacity=1000)
+    for t in range(200):
+        series.add(float(t), now=t)
+
+    stats = series.statistics(now=199)
+    assert stats[10.0]["count"] == 10
+    assert stats[10.0]["min"] == 190
+    assert stats[10.0]["max"] == 199
+    assert stats[10.0]["mean"] == pytest.approx(194.5)
+    assert stats[10.0]["coverage"] == 9
+    assert not stats[10.0]["truncated"]
+    assert stats[100.0]["count"] == 100
+    assert stats[100.0]["min"] == 100
+
+    # Querying later expires samples without new ones arriving
+    assert series.statistics(now=205)[10.0]["count"] == 4
+    assert series.statistics(now=1000)[100.0]["count"] == 0
+    assert series.statistics(now=1000)[100.0]["min"] is None
+
+
+def test_windows_match_brute_force_across_capacity_wrap():
+    rng = random.Random(1)
+    series = RollingStatistics(windows=(10, 100), capacity=50)
+    samples = []
+    for t in range(300):
+        value = rng.uniform(-5, 100)
+        series.add(value, now=t)
+        samples.append((t, value))
+
+    stats = series.statistics(now=299)
+    for span in (10.0, 100.0):
+        expected = [v for t, v in samples[-50:] if t > 299 - span]
+        assert stats[span]["count"] == len(expected)
+        assert stats[span]["min"] == min(expected)
+        assert stats[span]["max"] == max(expected)
+        assert stats[span]["mean"] == pytest.approx(sum(expected) / len(expected))
+
+
+def test_capacity_truncation_is_reported():
+    series = RollingStatistics(windows=(10, 100), capacity=40)
+    for t in range(300):
+        series.add(1.0, now=t * 2)
+
+    stats = series.statistics(now=598)
+    assert not stats[10.0]["truncated"]
+    assert stats[100.0]["truncated"]
+    assert stats[100.0]["count"] == 40
+    assert stats[100.0]["coverage"] == 78
+
+    # Samples dropped from the ring after they left the window by time are
+    # not truncation.
+    series = RollingStatistics(windows=(10,), capacity=2)
+    for t in (0, 5, 11):
+        series.add(1.0, now=t)
+
+    stats = series.statistics(now=11)
+    assert stats[10.0]["count"] == 2
+    assert not stats[10.0]["truncated"]
+
+
+def test_aggregator_sizes_capacity_from_sample_interval():
+    aggregator = TelemetryAggregator(windows=(60, 3600), sample_interval=2)
+    for t in range(2000):
+        aggregator.add("pump", {"id": 1, "watts": 300 + t % 10}, now=t * 2)
+
+    stats = aggregator.statistics(now=3998)["pump[1].watts"][3600.0]
+    assert not stats["truncated"]
+    assert stats["count"] == 1800
+
+
+def test_aggregator_tracks_configured_fields():
+    aggregator = TelemetryAggregator()
+    aggregator.add("pump", {"id": 1, "watts": 300, "rpm": 2000, "flow": None}, now=0)
+    aggregator.add("chemController", {"id": 1, "ph": {"level": 7.4}}, now=0)
+    aggregator.add("temps", {"waterSensor1": 80, "air": True}, now=0)
+    aggregator.add("circuit", {"id": 6, "isOn": True}, now=0)
+
+    stats = aggregator.statistics(now=1)
+    assert set(stats) == {
+        "pump[1].watts",
+        "pump[1].rpm",
+        "chemController[1].ph.level",
+        "temps.waterSensor1",
+    }
+    assert stats["chemController[1].ph.level"][60.0]["p50"] == pytest.approx(7.4)
+
+
+def test_non_finite_values_are_ignored():
+    aggregator = TelemetryAggregator(windows=(10,), capacity=4)
+    for t, watts in enumerate([300, float("inf"), float("nan"), float("-inf"), 310]):
+        aggregator.add("pump", {"id": 1, "watts": watts}, now=t)
+    for t in range(5, 30):
+        aggregator.add("pump", {"id": 1, "watts": 320}, now=t)
+
+    stats = aggregator.statistics(now=29)["pump[1].watts"][10.0]
+    assert stats["count"] == 4
+    assert stats["min"] == stats["max"] == 320